@@ -8,27 +8,183 @@ and orders are persisted using SQLite via SQLAlchemy.
 """
 
 import json
+import math
+import os
+import queue
+import re
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
 from datetime import datetime
 
 from flask import (
     Flask, render_template, request, redirect, url_for,
     session, jsonify
 )
+from flask.json.provider import DefaultJSONProvider, JSONProvider
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.pagination import SelectPagination
+from jinja2 import FileSystemBytecodeCache
+from sqlalchemy import event, insert
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import raiseload, sessionmaker
+from sqlalchemy.pool import QueuePool
 from werkzeug.security import generate_password_hash, check_password_hash
 from werkzeug.routing import BuildError
 
+try:
+    import orjson
+except ImportError:  # optional; Flask's stdlib json provider is used instead
+    orjson = None
+
 app = Flask(__name__)
 
+# Share compiled template bytecode across worker processes and restarts.
+# With no directory argument Jinja uses a per-user cache directory that it
+# creates with mode 0700 and refuses to use if someone else owns it.
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    JSON provider backed by orjson for request.get_json() and jsonify().
+    Flask's stdlib provider handles what orjson would get wrong: documents
+    with a run of 20+ digits (orjson parses integers beyond 64 bits as
+    floats) and values orjson refuses to encode, such as those integers.
+    Keys are sorted as with the default provider; output is always compact
+    and datetimes are encoded as ISO 8601 rather than HTTP dates.
+    """
+
+    # Any integer that does not fit in 64 bits has at least 20 digits.
+    _WIDE_NUMBER = re.compile(r"\d{20}")
+
+    def __init__(self, app) -> None:
+        super().__init__(app)
+        self._fallback = DefaultJSONProvider(app)
+
+    def dumps(self, obj, **kwargs) -> str:
+        # Formatting kwargs such as the session serializer's separators only
+        # apply to the stdlib fallback; orjson output is compact anyway.
+        try:
+            return orjson.dumps(
+                obj,
+                default=DefaultJSONProvider.default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS,
+            ).decode()
+        except TypeError:
+            return self._fallback.dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        text = s.decode("utf-8", "replace") if isinstance(s, (bytes, bytearray)) else s
+        if self._WIDE_NUMBER.search(text):
+            return self._fallback.loads(s, **kwargs)
+        return orjson.loads(s)
+
+
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
+
+def _json_dumps_compact(obj) -> str:
+    """Serialise JSON columns without the stdlib's padding spaces."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:  # e.g. integers wider than 64 bits
+            pass
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
 # Secret key used for sessions; in production set via environment variable
 app.config["SECRET_KEY"] = "change-me-please"
-app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///database.db"
+# DATABASE_URL lets deployments and the test suite point at another file
+app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get("DATABASE_URL", "sqlite:///database.db")
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 
+
+def _readonly_url(uri: str):
+    """Return a read-only SQLite URI that opens the same file as ``uri``."""
+    url = make_url(uri)
+    database = url.database
+    if url.query.get("uri") != "true":
+        database = f"file:{database}"
+    return url.set(database=database).update_query_dict({"mode": "ro", "uri": "true"})
+
+
+app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+    "pool_size": 10,
+    "max_overflow": 20,
+    "pool_pre_ping": True,
+    "connect_args": {"check_same_thread": False},
+    "json_serializer": _json_dumps_compact,
+}
+# Read-only pool used by the public pages and the dashboard so that reads
+# never queue behind the writer connection.
+app.config["SQLALCHEMY_BINDS"] = {
+    "readonly": {
+        "url": _readonly_url(app.config["SQLALCHEMY_DATABASE_URI"]),
+        "poolclass": QueuePool,
+        "pool_size": 8,
+        "pool_pre_ping": True,
+        "connect_args": {"check_same_thread": False},
+    },
+}
+
 db = SQLAlchemy(app)
 
+# WAL lets readers proceed while a write is in flight, and busy_timeout makes
+# SQLite retry on lock contention instead of failing with "database is locked".
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Apply the SQLite tuning pragmas to every new DBAPI connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def _set_readonly_pragmas(dbapi_connection, connection_record) -> None:
+    """Lock read connections down to queries only."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA query_only=1")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+with app.app_context():
+    event.listen(db.engine, "connect", _set_sqlite_pragmas)
+    event.listen(db.engines["readonly"], "connect", _set_readonly_pragmas)
+    _ReadSession = sessionmaker(bind=db.engines["readonly"])
+
+
+@contextmanager
+def read_session():
+    """Yield a session bound to the read-only pool, closing it afterwards."""
+    read = _ReadSession()
+    try:
+        yield read
+    finally:
+        read.close()
+
 
 # ---------------------- Models ---------------------- #
+# Relationship convention: declare relationships with back_populates and
+# lazy="selectin", e.g. relationship("OrderItem", back_populates="order",
+# lazy="selectin"), rather than a backref with the default lazy="select".
+# Listing pages such as the dashboard iterate many parents, and a lazy
+# relationship there issues one query per row. The dashboard's debug-only
+# raiseload("*") overrides mapper-level lazy= settings, selectin included, so
+# any relationship dashboard.html renders must also be listed as an explicit
+# selectinload(...) in DASHBOARD_ORDER_LOADERS / DASHBOARD_CONTACT_LOADERS.
 class Service(db.Model):
     """Represents a service offered by IgnitoSolutions."""
     id = db.Column(db.Integer, primary_key=True)
@@ -51,12 +207,15 @@ class User(db.Model):
 class Order(db.Model):
     """Represents a cart order submitted by a customer."""
     id = db.Column(db.Integer, primary_key=True)
-    items_json = db.Column(db.Text, nullable=False)
+    # Stored in the existing items_json TEXT column. Admin queries can read it
+    # server-side through SQLite's JSON1 functions, e.g.
+    # Order.items[0]["price"].as_float(), without json.loads in Python.
+    items = db.Column("items_json", db.JSON, nullable=False)
     total = db.Column(db.Float, nullable=False)
     name = db.Column(db.String(120), nullable=False)
     email = db.Column(db.String(120), nullable=False)
     message = db.Column(db.Text, nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
 
 
 class Contact(db.Model):
@@ -65,7 +224,7 @@ class Contact(db.Model):
     name = db.Column(db.String(120), nullable=False)
     email = db.Column(db.String(120), nullable=False)
     message = db.Column(db.Text, nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
 
 
 # ---------------------- Seed data ---------------------- #
@@ -75,8 +234,6 @@ DEFAULT_ADMIN_PASSWORD = "admin123"
 
 def seed_data() -> None:
     """Populate the database with an admin user and initial services."""
-    db.create_all()
-
     # Create admin if none exists
     if not User.query.first():
         admin = User(
@@ -87,7 +244,7 @@ def seed_data() -> None:
         db.session.commit()
 
     # Seed services if empty
-    if Service.query.count() == 0:
+    if db.session.query(Service.id).first() is None:
         services_seed = [
             {
                 "name": "Market Research",
@@ -132,17 +289,193 @@ def seed_data() -> None:
                 "image_file": "lead_generation.png",
             },
         ]
-        for svc in services_seed:
-            db.session.add(Service(**svc))
+        db.session.bulk_insert_mappings(Service, services_seed)
         db.session.commit()
 
 
+def ensure_indexes() -> None:
+    """Create indexes that create_all() skips on tables that already exist."""
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(db.engine, checkfirst=True)
+
+
+def schema_is_current() -> bool:
+    """Check with one sqlite_master query that every table and index exists."""
+    expected = set(db.metadata.tables)
+    for table in db.metadata.sorted_tables:
+        expected.update(index.name for index in table.indexes)
+    existing = set(db.session.execute(db.text("SELECT name FROM sqlite_master")).scalars())
+    return expected <= existing
+
+
 with app.app_context():
-    db.create_all()
+    if not schema_is_current():
+        db.create_all()
+        ensure_indexes()
     seed_data()
 
 
+# ---------------------- Batched writes ---------------------- #
+class BatchWriter:
+    """
+    Coalesce INSERTs from concurrent requests into a single transaction.
+    Rows are queued by submit() and written by a background thread, which
+    drains up to max_batch rows (waiting at most max_wait seconds after the
+    first) and commits them together, so a burst of submissions costs one
+    fsync. If that commit fails, each row is retried on its own so only the
+    offending submission sees the error. Rows whose future was cancelled
+    before the writer reached them are skipped, never inserted.
+    """
+
+    def __init__(self, max_batch: int = 100, max_wait: float = 0.01):
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def submit(self, model, values: dict) -> Future:
+        """Queue a row for insertion; the returned future resolves once committed."""
+        self._ensure_started()
+        future = Future()
+        self._queue.put((model, values, future))
+        return future
+
+    def _ensure_started(self) -> None:
+        # Started lazily so that the thread lives in the process serving
+        # requests (e.g. a forked gunicorn worker), not the one importing us.
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="batch-writer", daemon=True)
+                self._thread.start()
+
+    def _drain(self) -> list:
+        batch = [self._queue.get()]
+        if self._queue.empty():
+            # A lone submission is written straight away rather than held
+            # for max_wait in case company arrives.
+            return batch
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            self._process(self._drain())
+
+    def _process(self, batch: list) -> None:
+        """Write a drained batch, dropping rows whose submitter has given up."""
+        batch = [item for item in batch if item[2].set_running_or_notify_cancel()]
+        if not batch:
+            return
+        with app.app_context():
+            if not self._write_batch(batch):
+                self._write_rows(batch)
+
+    def _write_batch(self, batch: list) -> bool:
+        """Insert the whole batch in one transaction; return False if it failed."""
+        rows_by_model = {}
+        for model, values, _ in batch:
+            rows_by_model.setdefault(model, []).append(values)
+        try:
+            for model, rows in rows_by_model.items():
+                db.session.execute(insert(model), rows)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            return False
+        for _, _, future in batch:
+            future.set_result(None)
+        return True
+
+    def _write_rows(self, batch: list) -> None:
+        """Insert and commit rows one at a time, failing only the rows that error."""
+        for model, values, future in batch:
+            try:
+                db.session.execute(insert(model), [values])
+                db.session.commit()
+            except Exception as exc:
+                db.session.rollback()
+                future.set_exception(exc)
+            else:
+                future.set_result(None)
+
+
+batch_writer = BatchWriter()
+# Seconds a request waits for its row to be committed before giving up.
+BATCH_WRITE_TIMEOUT = 10
+
+
+def store_submission(model, values: dict):
+    """
+    Queue a row with the batch writer and wait for it to be committed.
+    Returns None once the row is stored, or an error response if the writer
+    did not get to it in time. A row still waiting in the queue is cancelled,
+    so the 503 retry advice cannot produce a duplicate; one the writer has
+    already started on is reported as accepted (202) instead.
+    """
+    future = batch_writer.submit(model, values)
+    try:
+        future.result(timeout=BATCH_WRITE_TIMEOUT)
+    except FutureTimeoutError:
+        if future.cancel():
+            return jsonify({"status": "error", "message": "Please try again shortly."}), 503
+        return jsonify({"status": "accepted"}), 202
+    return None
+
+
+# ---------------------- Service cache ---------------------- #
+# The service list is small and only changes through the admin portal, so it
+# is cached and dropped whenever an admin adds, edits or deletes a row. That
+# only clears this process's copy; the TTL bounds how long other workers keep
+# serving a list changed elsewhere.
+SERVICES_CACHE_TTL = 60
+# (services, monotonic expiry time), or None when nothing is cached.
+_services_cache = None
+# Bumped on every invalidation so that a load which raced with an admin write
+# does not store the rows it read before that write.
+_services_generation = 0
+_services_lock = threading.Lock()
+
+
+def get_services() -> list:
+    """Return all services, reloading them once the cached copy expires."""
+    global _services_cache
+    cached = _services_cache
+    if cached is not None and time.monotonic() < cached[1]:
+        return cached[0]
+    with _services_lock:
+        generation = _services_generation
+    with read_session() as s:
+        services = s.scalars(db.select(Service)).all()
+    with _services_lock:
+        if generation == _services_generation:
+            _services_cache = (services, time.monotonic() + SERVICES_CACHE_TTL)
+    return services
+
+
+def invalidate_services_cache() -> None:
+    """Force the next get_services() call to reload from the database."""
+    global _services_cache, _services_generation
+    with _services_lock:
+        _services_generation += 1
+        _services_cache = None
+
+
 # ---------------------- Template helpers ---------------------- #
+# Resolved once all routes are registered; see the URL cache block below.
+CHECKOUT_URL = "/checkout"
+ENDPOINTS = frozenset()
+
+
 def _compute_checkout_url() -> str:
     """
     Resolve the checkout endpoint if it exists; otherwise fall back to '/checkout'.
@@ -154,18 +487,38 @@ def _compute_checkout_url() -> str:
         return "/checkout"
 
 
+_hot_templates = {}
+
+
+def hot_template(name: str):
+    """
+    Return the compiled template for a frequently rendered page.
+    The Template object is kept for the life of the process so render_template
+    skips the loader lookup; with auto-reload on, the name is returned as-is.
+    """
+    if app.jinja_env.auto_reload:
+        return name
+    template = _hot_templates.get(name)
+    if template is None:
+        template = _hot_templates[name] = app.jinja_env.get_template(name)
+    return template
+
+
+def has_endpoint(name: str) -> bool:
+    """Check whether a view function is registered under ``name``."""
+    return name in ENDPOINTS
+
+
 @app.context_processor
 def utility_processor():
     """
     Expose helper(s) and common variables to all templates.
     - has_endpoint(name): check if a view function exists.
+    - endpoints: set of registered endpoint names, for `'name' in endpoints`.
     - checkout_url: safe URL for the checkout button/dropdown.
     """
-    def has_endpoint(name: str) -> bool:
-        return name in app.view_functions
-
     # Provide checkout_url as a value (not a function) so templates can use {{ checkout_url }}
-    return dict(has_endpoint=has_endpoint, checkout_url=_compute_checkout_url())
+    return dict(has_endpoint=has_endpoint, endpoints=ENDPOINTS, checkout_url=CHECKOUT_URL)
 
 
 # ---------------------- Auth utilities ---------------------- #
@@ -182,18 +535,45 @@ def admin_required(f):
     return decorated
 
 
+# ---------------------- HTTP caching ---------------------- #
+# Public pages whose content only changes on deploy or through the admin
+# portal; browsers and CDNs may reuse them for a few minutes.
+STATIC_ENDPOINTS = frozenset({
+    "index",
+    "services_page",
+    "about_page",
+    "blog_page",
+    "privacy_policy",
+    "terms_and_conditions",
+})
+STATIC_MAX_AGE = 300
+
+
+@app.after_request
+def add_cache_headers(response):
+    """Mark rarely-changing public pages as cacheable and answer revalidation with 304."""
+    if (
+        request.endpoint in STATIC_ENDPOINTS
+        and request.method == "GET"
+        and response.status_code == 200
+    ):
+        response.cache_control.public = True
+        response.cache_control.max_age = STATIC_MAX_AGE
+        response.add_etag()
+        response.make_conditional(request)
+    return response
+
+
 # ---------------------- Routes ---------------------- #
 @app.route("/")
 def index():
-    services = Service.query.all()
-    return render_template("index.html", services=services)
+    return render_template(hot_template("index.html"), services=get_services())
 
 
 @app.route("/services")
 def services_page():
     """Render the services page."""
-    services = Service.query.all()
-    return render_template("services.html", services=services)
+    return render_template(hot_template("services.html"), services=get_services())
 
 
 @app.route("/about")
@@ -218,9 +598,9 @@ def contact_page():
         message = data.get("message")
         if not all([name, email, message]):
             return jsonify({"status": "error", "message": "All fields are required."}), 400
-        contact = Contact(name=name, email=email, message=message)
-        db.session.add(contact)
-        db.session.commit()
+        error = store_submission(Contact, dict(name=name, email=email, message=message))
+        if error is not None:
+            return error
         return jsonify({"status": "success"})
     return render_template("contact.html")
 
@@ -231,42 +611,98 @@ def checkout_page():
     return render_template("checkout.html")
 
 
+def _parse_total(value):
+    """Return an order total as a finite float, or None if it is not a valid amount."""
+    if isinstance(value, bool):
+        return None
+    try:
+        total = float(value)
+    except (TypeError, ValueError):
+        return None
+    return total if math.isfinite(total) else None
+
+
 @app.route("/order", methods=["POST"])
 def order():
     """Handle cart checkout submissions."""
     data = request.get_json() or {}
+    if not isinstance(data, dict):
+        return jsonify({"status": "error", "message": "Invalid order payload."}), 400
     items = data.get("items", [])
     total = data.get("total", 0)
     name = data.get("name")
     email = data.get("email")
-    message = data.get("message", "")
+    message = data.get("message") or ""
 
-    if not items or not name or not email:
+    if not isinstance(items, list) or not items or not name or not email:
         return jsonify({"status": "error", "message": "Missing required information."}), 400
-
-    order = Order(
-        items_json=json.dumps(items),
-        total=float(total),
+    if not all(isinstance(value, str) for value in (name, email, message)):
+        return jsonify({"status": "error", "message": "Invalid order details."}), 400
+    total = _parse_total(total)
+    if total is None:
+        return jsonify({"status": "error", "message": "Invalid order total."}), 400
+
+    error = store_submission(Order, dict(
+        items=items,
+        total=total,
         name=name,
         email=email,
         message=message,
-    )
-    db.session.add(order)
-    db.session.commit()
+    ))
+    if error is not None:
+        return error
     return jsonify({"status": "success"})
 
 
 # ---------------------- Admin ---------------------- #
+# Number of orders/contacts shown per dashboard page.
+DASHBOARD_PAGE_SIZE = 50
+# Loader options for the relationships dashboard.html renders, e.g.
+# selectinload(Order.line_items). These take precedence over raiseload("*").
+DASHBOARD_ORDER_LOADERS = ()
+DASHBOARD_CONTACT_LOADERS = ()
+
+
+def dashboard_pages(s, orders_page_num: int, contacts_page_num: int, strict: bool = False):
+    """
+    Paginate orders and contacts for the dashboard using session ``s``.
+    With strict set, any relationship not named in the DASHBOARD_*_LOADERS
+    options raises on access instead of lazily issuing one query per row.
+    """
+    strict_options = (raiseload("*"),) if strict else ()
+    orders_page = SelectPagination(
+        select=db.select(Order)
+        .options(*DASHBOARD_ORDER_LOADERS, *strict_options)
+        .order_by(Order.created_at.desc()),
+        session=s,
+        page=orders_page_num,
+        per_page=DASHBOARD_PAGE_SIZE,
+        error_out=False,
+    )
+    contacts_page = SelectPagination(
+        select=db.select(Contact)
+        .options(*DASHBOARD_CONTACT_LOADERS, *strict_options)
+        .order_by(Contact.created_at.desc()),
+        session=s,
+        page=contacts_page_num,
+        per_page=DASHBOARD_PAGE_SIZE,
+        error_out=False,
+    )
+    return orders_page, contacts_page
+
+
 @app.route("/admin/login", methods=["GET", "POST"])
 def login():
     """Render and process the admin login form."""
     if request.method == "POST":
         username = request.form.get("username")
         password = request.form.get("password")
-        user = User.query.filter_by(username=username).first()
+        user = db.session.execute(
+            db.select(User).filter_by(username=username)
+        ).scalar_one_or_none()
         if user and user.verify_password(password):
             session["admin_logged_in"] = True
-            return redirect(url_for("dashboard"))
+            return redirect(DASHBOARD_URL)
         # Fall through to re-render with error
         return render_template("login.html", error="Invalid credentials")
     return render_template("login.html")
@@ -276,17 +712,28 @@ def login():
 def logout():
     """Log out the current admin user."""
     session.pop("admin_logged_in", None)
-    return redirect(url_for("login"))
+    return redirect(LOGIN_URL)
 
 
 @app.route("/admin/dashboard")
 @admin_required
 def dashboard():
     """Display the admin dashboard with services, orders and contacts."""
-    services = Service.query.all()
-    orders = Order.query.order_by(Order.created_at.desc()).all()
-    contacts = Contact.query.order_by(Contact.created_at.desc()).all()
-    return render_template("dashboard.html", services=services, orders=orders, contacts=contacts)
+    services = get_services()
+    orders_page_num = request.args.get("orders_page", 1, type=int)
+    contacts_page_num = request.args.get("contacts_page", 1, type=int)
+    with read_session() as s:
+        orders_page, contacts_page = dashboard_pages(
+            s, orders_page_num, contacts_page_num, strict=app.debug
+        )
+    return render_template(
+        "dashboard.html",
+        services=services,
+        orders=orders_page.items,
+        orders_page=orders_page,
+        contacts=contacts_page.items,
+        contacts_page=contacts_page,
+    )
 
 
 @app.route("/admin/services/add", methods=["GET", "POST"])
@@ -310,7 +757,8 @@ def add_service():
         )
         db.session.add(service)
         db.session.commit()
-        return redirect(url_for("dashboard"))
+        invalidate_services_cache()
+        return redirect(DASHBOARD_URL)
 
     return render_template("service_form.html", service=None)
 
@@ -328,7 +776,8 @@ def edit_service(service_id: int):
         if image_file:
             service.image_file = image_file
         db.session.commit()
-        return redirect(url_for("dashboard"))
+        invalidate_services_cache()
+        return redirect(DASHBOARD_URL)
     return render_template("service_form.html", service=service)
 
 
@@ -339,7 +788,8 @@ def delete_service(service_id: int):
     service = Service.query.get_or_404(service_id)
     db.session.delete(service)
     db.session.commit()
-    return redirect(url_for("dashboard"))
+    invalidate_services_cache()
+    return redirect(DASHBOARD_URL)
 
 
 # ---------------------- Legal ---------------------- #
@@ -355,6 +805,17 @@ def terms_and_conditions():
     return render_template("terms-and-conditions.html")
 
 
+# ---------------------- URL cache ---------------------- #
+# The URL map is fixed once the routes above are registered, so URLs used on
+# every request are built a single time instead of per render.
+ENDPOINTS = frozenset(app.view_functions)
+
+with app.test_request_context():
+    CHECKOUT_URL = _compute_checkout_url()
+    DASHBOARD_URL = url_for("dashboard")
+    LOGIN_URL = url_for("login")
+
+
 # ---------------------- Entry point ---------------------- #
 if __name__ == "__main__":
     app.run(debug=True)
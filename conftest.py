@@ -0,0 +1,16 @@
+"""
+Pytest configuration. Makes the top-level app module importable from tests/
+and points it at a throwaway SQLite file, so running the suite never creates,
+migrates or seeds the developer's instance/database.db.
+"""
+
+import os
+import shutil
+import tempfile
+
+_DB_DIR = tempfile.mkdtemp(prefix="ignito-tests-")
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(_DB_DIR, "test.db")
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(_DB_DIR, ignore_errors=True)
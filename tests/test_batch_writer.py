@@ -0,0 +1,121 @@
+"""Behaviour of the background BatchWriter behind /contact and /order."""
+
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+
+import app as ignito
+
+
+def idle_writer(**kwargs) -> ignito.BatchWriter:
+    """A BatchWriter whose background thread never starts; tests drive it by hand."""
+    writer = ignito.BatchWriter(**kwargs)
+    writer._ensure_started = lambda: None
+    return writer
+
+
+def contact(marker: str) -> dict:
+    return dict(name=marker, email="e@example.com", message="m")
+
+
+def count_contacts(marker: str) -> int:
+    with ignito.app.app_context():
+        return ignito.db.session.scalar(
+            ignito.db.select(ignito.db.func.count())
+            .select_from(ignito.Contact)
+            .filter_by(name=marker)
+        )
+
+
+def test_bad_row_fails_alone():
+    marker = uuid.uuid4().hex
+    writer = idle_writer()
+    good = [writer.submit(ignito.Contact, contact(marker)) for _ in range(5)]
+    bad = writer.submit(ignito.Order, dict(
+        items=[1], total=1.0, name=["not", "a", "string"], email="e", message="",
+    ))
+
+    writer._process(writer._drain())
+
+    assert [future.exception(timeout=0) for future in good] == [None] * 5
+    assert bad.exception(timeout=0) is not None
+    assert count_contacts(marker) == 5
+
+
+def test_lone_submission_is_not_held_for_max_wait():
+    writer = idle_writer(max_wait=1.0)
+    writer.submit(ignito.Contact, contact("lone"))
+
+    started = time.monotonic()
+    batch = writer._drain()
+
+    assert len(batch) == 1
+    assert time.monotonic() - started < 0.5
+
+
+def test_drain_is_bounded_by_one_deadline():
+    writer = idle_writer(max_wait=0.05)
+    writer.submit(ignito.Contact, contact("trickle"))
+    writer.submit(ignito.Contact, contact("trickle"))
+    stop = threading.Event()
+
+    def trickle():
+        # Each item arrives well inside max_wait of the previous one.
+        while not stop.is_set():
+            writer.submit(ignito.Contact, contact("trickle"))
+            time.sleep(0.005)
+
+    feeder = threading.Thread(target=trickle)
+    feeder.start()
+    try:
+        started = time.monotonic()
+        batch = writer._drain()
+        elapsed = time.monotonic() - started
+    finally:
+        stop.set()
+        feeder.join()
+
+    assert 1 < len(batch) < writer.max_batch
+    assert elapsed < 0.5
+
+
+def test_timed_out_submission_is_cancelled_and_never_written(monkeypatch):
+    marker = uuid.uuid4().hex
+    writer = idle_writer()
+    monkeypatch.setattr(ignito, "batch_writer", writer)
+    monkeypatch.setattr(ignito, "BATCH_WRITE_TIMEOUT", 0.01)
+
+    response = ignito.app.test_client().post("/contact", data=contact(marker))
+    assert response.status_code == 503
+
+    # The writer reaching the row afterwards must skip it, not insert it.
+    batch = writer._drain()
+    assert batch[0][2].cancelled()
+    writer._process(batch)
+    assert count_contacts(marker) == 0
+
+
+def test_submission_already_being_written_is_reported_as_accepted(monkeypatch):
+    writer = idle_writer()
+    monkeypatch.setattr(ignito, "batch_writer", writer)
+    monkeypatch.setattr(ignito, "BATCH_WRITE_TIMEOUT", 0.01)
+    original_submit = writer.submit
+
+    def submit_and_start(model, values) -> Future:
+        future = original_submit(model, values)
+        future.set_running_or_notify_cancel()
+        return future
+
+    monkeypatch.setattr(writer, "submit", submit_and_start)
+
+    response = ignito.app.test_client().post("/contact", data=contact(uuid.uuid4().hex))
+    assert response.status_code == 202
+    assert response.get_json() == {"status": "accepted"}
+
+
+def test_successful_submission_is_stored():
+    marker = uuid.uuid4().hex
+    response = ignito.app.test_client().post("/contact", data=contact(marker))
+    assert response.get_json() == {"status": "success"}
+    assert count_contacts(marker) == 1
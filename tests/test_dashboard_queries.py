@@ -0,0 +1,69 @@
+"""Guard the admin dashboard against N+1 query regressions."""
+
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+
+import app as ignito
+
+
+@pytest.fixture
+def session():
+    """A session whose writes are rolled back at the end of the test."""
+    with ignito.app.app_context():
+        with ignito.db.engine.connect() as connection:
+            transaction = connection.begin()
+            with Session(bind=connection) as s:
+                yield s
+            transaction.rollback()
+
+
+@contextmanager
+def count_queries(engine):
+    """Collect every SQL statement executed on ``engine`` inside the block."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def add_rows(s, count: int) -> None:
+    s.execute(insert(ignito.Order), [
+        dict(items=[{"name": "Item", "price": 1}], total=1.0, name="n", email="e", message="")
+        for _ in range(count)
+    ])
+    s.execute(insert(ignito.Contact), [
+        dict(name="n", email="e", message="m") for _ in range(count)
+    ])
+
+
+def render_dashboard_rows(s) -> int:
+    """Load a dashboard page and touch every attribute, as the template would."""
+    orders_page, contacts_page = ignito.dashboard_pages(s, 1, 1, strict=True)
+    rows = orders_page.items + contacts_page.items
+    for row in rows:
+        for attr in row.__mapper__.attrs.keys():
+            getattr(row, attr)
+    s.expunge_all()
+    return len(rows)
+
+
+def test_dashboard_query_count_does_not_grow_with_rows(session):
+    add_rows(session, 1)
+    with count_queries(ignito.db.engine) as few:
+        few_rows = render_dashboard_rows(session)
+
+    add_rows(session, 20)
+    with count_queries(ignito.db.engine) as many:
+        many_rows = render_dashboard_rows(session)
+
+    assert many_rows > few_rows
+    assert len(many) == len(few)
@@ -0,0 +1,17 @@
+"""Startup schema check and index migration for existing databases."""
+
+import app as ignito
+
+
+def test_ensure_indexes_brings_an_old_database_up_to_date():
+    with ignito.app.app_context():
+        assert ignito.schema_is_current()
+        # Simulate a database created before the index was declared.
+        with ignito.db.engine.begin() as connection:
+            connection.exec_driver_sql("DROP INDEX ix_order_created_at")
+        ignito.db.session.rollback()
+        assert not ignito.schema_is_current()
+
+        ignito.ensure_indexes()
+
+        assert ignito.schema_is_current()